@@ -1,4 +1,5 @@
 import numpy as np
+from enum import IntEnum
 '''
 List of damage types and their indices
 0   Impact
@@ -93,6 +94,91 @@ PROC_INFO = {0:{"name":"Impact", "duration":6, "max_stacks":5}, 1:{"name":"Punct
              9:{"name":"Gas", "duration":6, "max_stacks":10}, 10:{"name":"Magnetic", "duration":6, "max_stacks":10}, 11:{"name":"Viral", "duration":6, "max_stacks":10}, 
              12:{"name":"Corrosive", "duration":8, "max_stacks":10}, 13:{"name":"Void", "duration":3, "max_stacks":1}}
 
+class Mod(IntEnum):
+    """Index of each mod value in a FireMode's mod vector"""
+    DAMAGE_PER_SHOT_BASE = 0
+    DAMAGE_PER_SHOT_CONDITION_OVERLOAD_BASE = 1
+    DAMAGE_PER_SHOT_CONDITION_OVERLOAD_MULTIPLIER = 2
+    DAMAGE_PER_SHOT_DIRECT = 3
+    DAMAGE_PER_SHOT_FINAL_MULTIPLIER = 4
+    DAMAGE_PER_SHOT_MULTISHOT_MULTIPLIER = 5
+    BONUS_DAMAGE_PER_SHOT_ADDITIVE_BASE = 6
+    CRITICAL_CHANCE_BASE = 7
+    CRITICAL_CHANCE_ADDITIVE_BASE = 8
+    CRITICAL_CHANCE_ADDITIVE_FINAL = 9
+    CRITICAL_CHANCE_COVENANT = 10
+    CRITICAL_CHANCE_DEADLY_MUNITIONS = 11
+    CRITICAL_MULTIPLIER_BASE = 12
+    CRITICAL_MULTIPLIER_ADDITIVE_BASE = 13
+    CRITICAL_MULTIPLIER_ADDITIVE_FINAL = 14
+    CRITICAL_MULTIPLIER_FINAL_MULTIPLIER = 15
+    PROC_CHANCE_BASE = 16
+    PROC_CHANCE_ADDITIVE_BASE = 17
+    PROC_CHANCE_ADDITIVE_FINAL = 18
+    PROC_CHANCE_FINAL_MULTIPLIER = 19
+    PROC_CHANCE_MULTISHOT_MULTIPLIER = 20
+    MAGAZINE_SIZE_BASE = 21
+    FIRE_RATE_BASE = 22
+    FIRE_RATE_FINAL_MULTIPLIER = 23
+    RELOAD_TIME_BASE = 24
+    MULTISHOT_BASE = 25
+    HEAT_BASE = 26
+    HEAT_UNCOMBINABLE = 27
+    COLD_BASE = 28
+    COLD_UNCOMBINABLE = 29
+    ELECTRIC_BASE = 30
+    ELECTRIC_UNCOMBINABLE = 31
+    TOXIN_BASE = 32
+    TOXIN_UNCOMBINABLE = 33
+    BLAST_BASE = 34
+    RADIATION_BASE = 35
+    GAS_BASE = 36
+    MAGNETIC_BASE = 37
+    VIRAL_BASE = 38
+    CORROSIVE_BASE = 39
+    IMPACT_BASE = 40
+    IMPACT_STANCE = 41
+    PUNCTURE_BASE = 42
+    PUNCTURE_STANCE = 43
+    SLASH_BASE = 44
+    SLASH_STANCE = 45
+    STATUS_DURATION_BASE = 46
+    FACTION_DAMAGE_BASE = 47
+    AMMO_COST_BASE = 48
+    AMMO_COST_ENERGIZED_MUNITIONS = 49
+
+# mod names as used by the mod loading code, ex. "criticalChance.additive_base"
+MOD_INDEX = {"damagePerShot.base":Mod.DAMAGE_PER_SHOT_BASE, "damagePerShot.condition_overload_base":Mod.DAMAGE_PER_SHOT_CONDITION_OVERLOAD_BASE,
+             "damagePerShot.condition_overload_multiplier":Mod.DAMAGE_PER_SHOT_CONDITION_OVERLOAD_MULTIPLIER, "damagePerShot.direct":Mod.DAMAGE_PER_SHOT_DIRECT,
+             "damagePerShot.final_multiplier":Mod.DAMAGE_PER_SHOT_FINAL_MULTIPLIER, "damagePerShot.multishot_multiplier":Mod.DAMAGE_PER_SHOT_MULTISHOT_MULTIPLIER,
+             "bonusDamagePerShot.additive_base":Mod.BONUS_DAMAGE_PER_SHOT_ADDITIVE_BASE,
+             "criticalChance.base":Mod.CRITICAL_CHANCE_BASE, "criticalChance.additive_base":Mod.CRITICAL_CHANCE_ADDITIVE_BASE,
+             "criticalChance.additive_final":Mod.CRITICAL_CHANCE_ADDITIVE_FINAL, "criticalChance.covenant":Mod.CRITICAL_CHANCE_COVENANT,
+             "criticalChance.deadly_munitions":Mod.CRITICAL_CHANCE_DEADLY_MUNITIONS,
+             "criticalMultiplier.base":Mod.CRITICAL_MULTIPLIER_BASE, "criticalMultiplier.additive_base":Mod.CRITICAL_MULTIPLIER_ADDITIVE_BASE,
+             "criticalMultiplier.additive_final":Mod.CRITICAL_MULTIPLIER_ADDITIVE_FINAL, "criticalMultiplier.final_multiplier":Mod.CRITICAL_MULTIPLIER_FINAL_MULTIPLIER,
+             "procChance.base":Mod.PROC_CHANCE_BASE, "procChance.additive_base":Mod.PROC_CHANCE_ADDITIVE_BASE, "procChance.additive_final":Mod.PROC_CHANCE_ADDITIVE_FINAL,
+             "procChance.final_multiplier":Mod.PROC_CHANCE_FINAL_MULTIPLIER, "procChance.multishot_multiplier":Mod.PROC_CHANCE_MULTISHOT_MULTIPLIER,
+             "magazineSize.base":Mod.MAGAZINE_SIZE_BASE, "fireRate.base":Mod.FIRE_RATE_BASE, "fireRate.final_multiplier":Mod.FIRE_RATE_FINAL_MULTIPLIER,
+             "reloadTime.base":Mod.RELOAD_TIME_BASE, "multishot.base":Mod.MULTISHOT_BASE,
+             "heat.base":Mod.HEAT_BASE, "heat.uncombinable":Mod.HEAT_UNCOMBINABLE, "cold.base":Mod.COLD_BASE, "cold.uncombinable":Mod.COLD_UNCOMBINABLE,
+             "electric.base":Mod.ELECTRIC_BASE, "electric.uncombinable":Mod.ELECTRIC_UNCOMBINABLE, "toxin.base":Mod.TOXIN_BASE, "toxin.uncombinable":Mod.TOXIN_UNCOMBINABLE,
+             "blast.base":Mod.BLAST_BASE, "radiation.base":Mod.RADIATION_BASE, "gas.base":Mod.GAS_BASE,
+             "magnetic.base":Mod.MAGNETIC_BASE, "viral.base":Mod.VIRAL_BASE, "corrosive.base":Mod.CORROSIVE_BASE,
+             "impact.base":Mod.IMPACT_BASE, "impact.stance":Mod.IMPACT_STANCE, "puncture.base":Mod.PUNCTURE_BASE, "puncture.stance":Mod.PUNCTURE_STANCE,
+             "slash.base":Mod.SLASH_BASE, "slash.stance":Mod.SLASH_STANCE,
+             "statusDuration.base":Mod.STATUS_DURATION_BASE, "factionDamage.base":Mod.FACTION_DAMAGE_BASE,
+             "ammoCost.base":Mod.AMMO_COST_BASE, "ammoCost.energized_munitions":Mod.AMMO_COST_ENERGIZED_MUNITIONS}
+
+# unmodded value of every mod, multipliers start at 1 and everything else at 0
+MOD_DEFAULTS = np.zeros(len(Mod))
+MOD_DEFAULTS[[Mod.DAMAGE_PER_SHOT_FINAL_MULTIPLIER, Mod.DAMAGE_PER_SHOT_MULTISHOT_MULTIPLIER, Mod.CRITICAL_CHANCE_DEADLY_MUNITIONS,
+              Mod.CRITICAL_MULTIPLIER_FINAL_MULTIPLIER, Mod.PROC_CHANCE_FINAL_MULTIPLIER, Mod.PROC_CHANCE_MULTISHOT_MULTIPLIER,
+              Mod.FIRE_RATE_FINAL_MULTIPLIER]] = 1
+
+# mod scaling the bonus damage of damage types 0-6, physical types scale with their own damage and elements with the total
+ELEMENT_MODS = np.array([Mod.IMPACT_BASE, Mod.PUNCTURE_BASE, Mod.SLASH_BASE, Mod.HEAT_BASE, Mod.COLD_BASE, Mod.ELECTRIC_BASE, Mod.TOXIN_BASE])
+
 MAX_TIME_OFFSET = 1000
 
 COMBINE_ADD = "COMBINE_ADD"
@@ -106,11 +192,14 @@ UNCOMBINED_RULE =r"(?<=^ue)(?:\d+(?:\.\d*)?|\.\d+)(?=$|[\s,])|(?<=[\s,]ue)(?:\d+
 MULTIPLIER_RULE =r"(?<=^x)(?:\d+(?:\.\d*)?|\.\d+)(?=$|[\s,])|(?<=[\s,]x)(?:\d+(?:\.\d*)?|\.\d+)(?=$|[\s,])"
 PERCENT_RULE =r"(?<=^)(?:-?\d+(?:\.\d*)?|-?\.\d+)(?=%$|%[\s,])|(?<=[\s,])(?:-?\d+(?:\.\d*)?|\.\d+)(?=%$|%[\s,])"
 
-DAMAGE_NONE = np.array([0]*20)
+DAMAGE_NONE = np.zeros(20)
 
 HEAT_ARMOR_STRIP = {0:1, 1:0.85, 2:0.7, 3:0.6, 4:0.5}
 CORROSIVE_ARMOR_STRIP = {0:1, 1:0.74, 2:0.68, 3:0.62, 4:0.56, 5:0.50, 6:0.44, 7:0.38, 8:0.32, 9:0.26, 10:0.2}
 VIRAL_DEBUFF = {0:1, 1:2, 2:2.25, 3:2.5, 4:2.75, 5:3, 6:3.25, 7:3.5, 8:3.75, 9:4, 10:4.25}
 MAGNETIC_DEBUFF = {0:1, 1:2, 2:2.25, 3:2.5, 4:2.75, 5:3, 6:3.25, 7:3.5, 8:3.75, 9:4, 10:4.25}
 
-ARMOR_RATIO = 1/300
\ No newline at end of file
+ARMOR_RATIO = 1/300
+
+CRITICAL_MULTIPLIER_QUANTUM = 128 - 1/32
+CRITICAL_MULTIPLIER_QUANTUM_INV = 1/CRITICAL_MULTIPLIER_QUANTUM
\ No newline at end of file
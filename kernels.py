@@ -0,0 +1,63 @@
+from pathlib import Path
+from numba import njit
+
+from constants import Mod, ELEMENT_MODS
+
+# Hot numeric kernels. They are jit compiled on first use and cached, running this file
+# compiles them ahead of time into the warframe_kernels extension module next to it,
+# which weapon.py imports instead when available to skip the jit warmup.
+
+APPLY_MODS_KERNEL_SIGNATURE = "void(f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:])"
+
+@njit(cache=True, fastmath=True)
+def apply_mods_kernel(base, mods, out_modded, out_quantized, out_elem_modded, out_elem_quantized, proc_probs):
+    # fused damage pipeline of FireMode.apply_mods, all outputs are written in place
+    n = base.shape[0]
+    # bonus damage is spread over the damage types by weight, most builds have none
+    bonus = mods[Mod.BONUS_DAMAGE_PER_SHOT_ADDITIVE_BASE]
+    bonus_scale = 0.0
+    if bonus != 0:
+        tot = 0.0
+        for i in range(n):
+            tot += base[i]
+        bonus_scale = bonus / max(tot, 0.01)
+
+    total_base_damage = 0.0
+    for i in range(n):
+        out_modded[i] = (base[i] + base[i] * bonus_scale) * (1 + mods[Mod.DAMAGE_PER_SHOT_BASE]) * \
+                            mods[Mod.DAMAGE_PER_SHOT_MULTISHOT_MULTIPLIER] * mods[Mod.DAMAGE_PER_SHOT_FINAL_MULTIPLIER]
+        total_base_damage += out_modded[i]
+
+    # Bonus damage types
+    for i in range(ELEMENT_MODS.shape[0]):
+        scale_src = out_modded[i] if i < 3 else total_base_damage
+        out_elem_modded[i] = scale_src * mods[ELEMENT_MODS[i]]
+
+    elem_tot = 0.0
+    for i in range(n):
+        elem_tot += out_elem_modded[i]
+    quanta = (total_base_damage + elem_tot) / 16
+
+    tot_weight = 0.0
+    for i in range(n):
+        if quanta > 0:
+            out_quantized[i] = round(out_modded[i] / quanta) * quanta
+            out_elem_quantized[i] = round(out_elem_modded[i] / quanta) * quanta
+        else:
+            out_quantized[i] = out_modded[i]
+            out_elem_quantized[i] = out_elem_modded[i]
+        proc_probs[i] = out_modded[i] + out_elem_modded[i]
+        tot_weight += proc_probs[i]
+
+    # self.procProbabilities *= self.procImmunities
+    proc_scale = 1 / tot_weight if tot_weight > 0 else 0.0
+    for i in range(n):
+        proc_probs[i] *= proc_scale
+
+if __name__ == "__main__":
+    from numba.pycc import CC
+
+    cc = CC("warframe_kernels")
+    cc.output_dir = str(Path(__file__).parent.resolve())
+    cc.export("apply_mods_kernel", APPLY_MODS_KERNEL_SIGNATURE)(apply_mods_kernel.py_func)
+    cc.compile()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from collections import deque
+import heapq
 import numpy as np
 import constants
+from constants import Mod
 from typing import List, TYPE_CHECKING
 
 from weapon import EventTrigger, FireMode
@@ -31,7 +33,7 @@ class ProcContainer:
         self.simulation = enemy.simulation
         self.index = index
         self.next_event = constants.MAX_TIME_OFFSET
-        self.total_damage = np.array([0]*20, dtype=float)
+        self.total_damage = np.zeros(20)
         self.proc_dq: deque[Proc] = deque([])
         self.count = 0
 
@@ -39,8 +41,8 @@ class ProcContainer:
         # If it is a new container, set the event time to first proc
         if self.count == 0:
             self.next_event = proc.next_event
-            self.simulation.event_queue.put((self.next_event, self.simulation.get_call_index(), EventTrigger(proc.fire_mode, self.damage_event, self.next_event)))
-            self.simulation.event_queue.put((proc.expiry, self.simulation.get_call_index(), EventTrigger(proc.fire_mode, self.expiry_event, proc.expiry)))
+            heapq.heappush(self.simulation.event_queue, (self.next_event, self.simulation.get_call_index(), EventTrigger(proc.fire_mode, self.damage_event, self.next_event)))
+            heapq.heappush(self.simulation.event_queue, (proc.expiry, self.simulation.get_call_index(), EventTrigger(proc.fire_mode, self.expiry_event, proc.expiry)))
             if self.manager.count == 0:
                 self.enemy.unique_proc_count += 1
 
@@ -56,13 +58,13 @@ class ProcContainer:
         self.manager.total_applied_damage += app_dmg
 
         self.next_event += 1
-        self.simulation.event_queue.put((self.next_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_event)))
+        heapq.heappush(self.simulation.event_queue, (self.next_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_event)))
 
     def expiry_event(self, fire_mode, enemy):
         if self.count>0 and self.simulation.time >= self.proc_dq[0].expiry:
             self.total_damage[self.manager.proc_id] -= self.proc_dq[0].damage
             self.proc_dq.popleft()
-            self.simulation.event_queue.put((self.proc_dq[0].expiry, self.simulation.get_call_index(), EventTrigger(self.proc_dq[0].fire_mode, self.expiry_event, self.proc_dq[0].expiry)))
+            heapq.heappush(self.simulation.event_queue, (self.proc_dq[0].expiry, self.simulation.get_call_index(), EventTrigger(self.proc_dq[0].fire_mode, self.expiry_event, self.proc_dq[0].expiry)))
             self.count -= 1
             self.manager.count -= 1
             if self.manager.count == 0:
@@ -88,13 +90,13 @@ class DefaultProcManager():
         self.count = 0
 
     def add_proc(self, fire_mode: FireMode, damage: np.array):
-        duration = self.base_duration * (1 + fire_mode.statusDuration_m["base"])
-        new_proc = Proc(self.enemy, fire_mode, duration, sum(damage))
+        duration = self.base_duration * (1 + fire_mode.mods[Mod.STATUS_DURATION_BASE])
+        new_proc = Proc(self.enemy, fire_mode, duration, damage.sum())
         delta = False
 
         if self.count == 0:
             self.next_event = new_proc.expiry
-            self.simulation.event_queue.put((self.next_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.remove_expired_proc, self.next_event)))
+            heapq.heappush(self.simulation.event_queue, (self.next_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.remove_expired_proc, self.next_event)))
             delta = True
             self.enemy.unique_proc_count += 1
         elif self.count == self.max_stacks:
@@ -125,7 +127,7 @@ class DefaultProcManager():
             
             if self.count > 0:
                 self.next_event = self.proc_dq[0].expiry
-                self.simulation.event_queue.put((self.next_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.remove_expired_proc, self.next_event)))
+                heapq.heappush(self.simulation.event_queue, (self.next_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.remove_expired_proc, self.next_event)))
 
             if self.count_change_callback is not None:
                 self.count_change_callback(self)
@@ -150,13 +152,13 @@ class ContainerizedProcManager:
         self.count = 0
 
     def add_proc(self, fire_mode:FireMode, damage:np.array):
-        duration = self.base_duration * (1 + fire_mode.statusDuration_m["base"])
+        duration = self.base_duration * (1 + fire_mode.mods[Mod.STATUS_DURATION_BASE])
         if self.proc_id == 2:
-            damage = 0.35 * sum(damage) 
+            damage = 0.35 * damage.sum() 
         elif self.proc_id == 6:
-            damage = 0.5 * sum(damage)  * (1 + fire_mode.toxin_m["base"])
+            damage = 0.5 * damage.sum()  * (1 + fire_mode.mods[Mod.TOXIN_BASE])
         else:
-            damage = sum(damage) 
+            damage = damage.sum() 
         
         new_proc = Proc(self.enemy, fire_mode, duration, damage)
 
@@ -184,7 +186,7 @@ class AOEProcManager:
         self.proc_dq: deque[Proc]= deque([])
         self.init_time: int = constants.MAX_TIME_OFFSET
         self.next_tick_event: float = self.init_time
-        self.total_damage: np.array = np.array([0]*20, dtype=float)
+        self.total_damage: np.array = np.zeros(20)
         
         self.total_applied_damage: float = 0
         self.count = 0
@@ -199,15 +201,15 @@ class AOEProcManager:
         self.count = 0
 
     def add_proc(self, fire_mode:FireMode, damage: np.array):
-        duration = self.base_duration * (1 + fire_mode.statusDuration_m["base"])
+        duration = self.base_duration * (1 + fire_mode.mods[Mod.STATUS_DURATION_BASE])
 
         if self.count == 0:
             self.init_time = self.simulation.time
             self.next_tick_event = self.init_time
-            self.simulation.event_queue.put((self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
+            heapq.heappush(self.simulation.event_queue, (self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
 
             expiry = self.simulation.time + duration
-            self.simulation.event_queue.put((expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, expiry)))
+            heapq.heappush(self.simulation.event_queue, (expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, expiry)))
             self.enemy.unique_proc_count += 1
         elif self.count >= self.max_stacks:
             # remove oldest proc
@@ -217,11 +219,11 @@ class AOEProcManager:
                 self.count -= 1
 
         if self.proc_id == 5: # can replace with index
-            damage = 0.5 * sum(damage)  * (1 + fire_mode.electric_m["base"])
+            damage = 0.5 * damage.sum()  * (1 + fire_mode.mods[Mod.ELECTRIC_BASE])
         elif self.proc_id == 9:
-            damage = 0.5 * sum(damage) 
+            damage = 0.5 * damage.sum() 
         else:
-            damage = sum(damage) 
+            damage = damage.sum() 
 
         new_proc = Proc(self.enemy, fire_mode, duration, damage)
         self.total_damage[self.proc_id] += new_proc.damage
@@ -237,7 +239,7 @@ class AOEProcManager:
         self.total_applied_damage += applied_dmg
         self.next_tick_event += 1
         # always put on event queue because even if expiry is imminent, another refresher proc can happen before then
-        self.simulation.event_queue.put((self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
+        heapq.heappush(self.simulation.event_queue, (self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
 
     def expiry_event(self, fire_mode, enemy):
         if self.count == 0:
@@ -252,7 +254,7 @@ class AOEProcManager:
                 self.enemy.unique_proc_count -= 1
 
             if self.count > 0:
-                self.simulation.event_queue.put((self.proc_dq[0].expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, self.proc_dq[0].expiry)))
+                heapq.heappush(self.simulation.event_queue, (self.proc_dq[0].expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, self.proc_dq[0].expiry)))
 
     
 class HeatProcManager:
@@ -270,7 +272,7 @@ class HeatProcManager:
         self.next_tick_event = constants.MAX_TIME_OFFSET
         self.expiry = 0
 
-        self.total_damage = np.array([0]*20, dtype=float)
+        self.total_damage = np.zeros(20)
         self.count = 0
 
         self.enemy = enemy
@@ -305,19 +307,19 @@ class HeatProcManager:
             self.init_time = self.simulation.time
             self.next_tick_event = self.init_time + 1
             
-            duration = self.base_duration * (1 + fire_mode.statusDuration_m["base"])
+            duration = self.base_duration * (1 + fire_mode.mods[Mod.STATUS_DURATION_BASE])
             expiry = self.simulation.time + duration
-            damage = 0.5 * sum(damage)  * (1 + fire_mode.heat_m["base"])
+            damage = 0.5 * damage.sum()  * (1 + fire_mode.mods[Mod.HEAT_BASE])
 
-            armor_strip_delay = self.base_armor_strip_delay * (1 + fire_mode.statusDuration_m["base"])
+            armor_strip_delay = self.base_armor_strip_delay * (1 + fire_mode.mods[Mod.STATUS_DURATION_BASE])
             # schedule heat strip
-            self.simulation.event_queue.put((self.simulation.time + armor_strip_delay, self.simulation.get_call_index(), EventTrigger(fire_mode, self.armor_strip_event, self.simulation.time + armor_strip_delay)))
-            self.simulation.event_queue.put((self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
-            self.simulation.event_queue.put((expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, expiry)))
+            heapq.heappush(self.simulation.event_queue, (self.simulation.time + armor_strip_delay, self.simulation.get_call_index(), EventTrigger(fire_mode, self.armor_strip_event, self.simulation.time + armor_strip_delay)))
+            heapq.heappush(self.simulation.event_queue, (self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
+            heapq.heappush(self.simulation.event_queue, (expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, expiry)))
             self.enemy.unique_proc_count += 1
         else:
-            damage = 0.5 * sum(damage) * (1 + self.proc_dq[0].fire_mode.heat_m["base"])
-            duration = self.base_duration * (1 + self.proc_dq[0].fire_mode.statusDuration_m["base"])
+            damage = 0.5 * damage.sum() * (1 + self.proc_dq[0].fire_mode.mods[Mod.HEAT_BASE])
+            duration = self.base_duration * (1 + self.proc_dq[0].fire_mode.mods[Mod.STATUS_DURATION_BASE])
     
         new_proc = Proc(self.enemy, fire_mode, duration, damage)
         self.expiry = new_proc.expiry
@@ -334,21 +336,21 @@ class HeatProcManager:
         self.total_applied_damage += applied_dmg
         self.next_tick_event += 1
         # always put on event queue because even if expiry is imminent, another refresher proc can happen before then
-        self.simulation.event_queue.put((self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
+        heapq.heappush(self.simulation.event_queue, (self.next_tick_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.damage_event, self.next_tick_event)))
 
     def expiry_event(self, fire_mode, enemy):
         if self.count == 0:
             return
         
         if self.expiry <= self.simulation.time:
-            armor_regen_delay = self.base_armor_regen_delay * (1 + self.proc_dq[0].fire_mode.statusDuration_m["base"])
+            armor_regen_delay = self.base_armor_regen_delay * (1 + self.proc_dq[0].fire_mode.mods[Mod.STATUS_DURATION_BASE])
             # before reset, pass the fire_mode from the original proc so the status duration is preserved
-            self.simulation.event_queue.put((self.simulation.time + armor_regen_delay, self.simulation.get_call_index(), EventTrigger(self.proc_dq[0].fire_mode, self.armor_regen_event, self.simulation.time + armor_regen_delay)))
+            heapq.heappush(self.simulation.event_queue, (self.simulation.time + armor_regen_delay, self.simulation.get_call_index(), EventTrigger(self.proc_dq[0].fire_mode, self.armor_regen_event, self.simulation.time + armor_regen_delay)))
             self.count = 0
             self.clear_proc()
             self.enemy.unique_proc_count -= 1
         else:
-            self.simulation.event_queue.put((self.expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, self.expiry)))  
+            heapq.heappush(self.simulation.event_queue, (self.expiry, self.simulation.get_call_index(), EventTrigger(fire_mode, self.expiry_event, self.expiry)))  
 
     def armor_strip_event(self, fire_mode: FireMode, enemy:Unit):
         self.strip_index += 1
@@ -360,8 +362,8 @@ class HeatProcManager:
         enemy.armor.apply_affliction("Heat armor strip", strip_value)
 
         if self.strip_index < 4:
-            armor_strip_delay = self.base_armor_strip_delay * (1 + self.proc_dq[0].fire_mode.statusDuration_m["base"])
-            self.simulation.event_queue.put((self.simulation.time + armor_strip_delay, self.simulation.get_call_index(), EventTrigger(fire_mode, self.armor_strip_event, self.simulation.time + armor_strip_delay)))
+            armor_strip_delay = self.base_armor_strip_delay * (1 + self.proc_dq[0].fire_mode.mods[Mod.STATUS_DURATION_BASE])
+            heapq.heappush(self.simulation.event_queue, (self.simulation.time + armor_strip_delay, self.simulation.get_call_index(), EventTrigger(fire_mode, self.armor_strip_event, self.simulation.time + armor_strip_delay)))
 
     def armor_regen_event(self, fire_mode: FireMode, enemy:Unit):
         # if another proc happens, return
@@ -376,5 +378,5 @@ class HeatProcManager:
         strip_value = constants.HEAT_ARMOR_STRIP[self.strip_index]
         enemy.armor.apply_affliction("Heat armor strip", strip_value)
         if self.strip_index > 0:
-            armor_regen_delay = self.base_armor_regen_delay * (1 + fire_mode.statusDuration_m["base"])
-            self.simulation.event_queue.put((self.simulation.time + armor_regen_delay, self.simulation.get_call_index(), EventTrigger(fire_mode, self.armor_regen_event, self.simulation.time + armor_regen_delay)))
+            armor_regen_delay = self.base_armor_regen_delay * (1 + fire_mode.mods[Mod.STATUS_DURATION_BASE])
+            heapq.heappush(self.simulation.event_queue, (self.simulation.time + armor_regen_delay, self.simulation.get_call_index(), EventTrigger(fire_mode, self.armor_regen_event, self.simulation.time + armor_regen_delay)))
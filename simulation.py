@@ -1,7 +1,7 @@
 from weapon import Weapon, FireMode, FireModeEffect, EventTrigger
 from unit import Unit
 from typing import List, Tuple
-from queue import PriorityQueue
+import heapq
 import seaborn as sns
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -9,14 +9,14 @@ import time
 
 class Simulacrum:
     def __init__(self) -> None:
-        self.event_queue:"PriorityQueue[Tuple[int, int, EventTrigger]]" = PriorityQueue()
+        self.event_queue:List[Tuple[int, int, EventTrigger]] = []
         self.time = 0
         self.call_index = 0
 
     def reset(self):
         self.time = 0
         self.call_index = 0
-        self.event_queue = PriorityQueue()
+        self.event_queue = []
 
     def get_call_index(self):
         idx = self.call_index
@@ -29,10 +29,10 @@ class Simulacrum:
         data = [stats]
 
         event_time = fire_mode.chargeTime.modded + fire_mode.embedDelay.modded
-        self.event_queue.put((event_time, self.get_call_index(), EventTrigger(fire_mode, fire_mode.pull_trigger, event_time)))
+        heapq.heappush(self.event_queue, (event_time, self.get_call_index(), EventTrigger(fire_mode, fire_mode.pull_trigger, event_time)))
         for enemy in enemies:
             while enemy.overguard.current_value > 0 or enemy.health.current_value > 0:
-                self.time, _, event = self.event_queue.get()
+                self.time, _, event = heapq.heappop(self.event_queue)
                 event.func(event.fire_mode, enemy)
 
                 if stats_changed(data[-1], enemy):
@@ -55,10 +55,10 @@ class Simulacrum:
 
     def fast_run(self, enemies:List[Unit], fire_mode:FireMode):
         event_time = fire_mode.chargeTime.modded + fire_mode.embedDelay.modded
-        self.event_queue.put((event_time, self.get_call_index(), EventTrigger(fire_mode, fire_mode.pull_trigger, event_time)))
+        heapq.heappush(self.event_queue, (event_time, self.get_call_index(), EventTrigger(fire_mode, fire_mode.pull_trigger, event_time)))
         for enemy in enemies:
             while enemy.overguard.current_value > 0 or enemy.health.current_value > 0:
-                self.time, _, event = self.event_queue.get()
+                self.time, _, event = heapq.heappop(self.event_queue)
                 event.func(event.fire_mode, enemy)
                 
                 if self.time > 20 :
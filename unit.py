@@ -9,6 +9,7 @@ import math
 import procs as pm
 
 import constants
+from constants import Mod
 from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,7 +29,7 @@ class Unit:
         self.faction:str = unit_data["faction"]
         self.type: str = unit_data["type"]
         self.is_eximus:bool = unit_data.get("is_eximus", False)
-        self.procImmunities: np.array = np.array([1]*20, dtype=float)
+        self.procImmunities: np.array = np.ones(20)
 
         self.health = Protection(self, unit_data["base_health"], "health", unit_data["health_type"])
         self.armor = Protection(self, unit_data["base_armor"], "armor", unit_data["armor_type"])
@@ -38,7 +39,7 @@ class Unit:
         self.proc_controller = ProcController(self)
 
         self.unique_proc_count = 0
-        self.armor_dr = np.array([1]*20, dtype=float)
+        self.armor_dr = np.ones(20)
         self.set_armor_dr()
 
 
@@ -83,7 +84,7 @@ class Unit:
         damage_status *= 1
 
         # # faction bonuses
-        faction_bonus = (1 + fire_mode.factionDamage_m["base"])
+        faction_bonus = (1 + fire_mode.mods[Mod.FACTION_DAMAGE_BASE])
         damage_total *= faction_bonus
         damage_status *= faction_bonus
 
@@ -137,12 +138,12 @@ class Unit:
         shield = self.shield.current_value
         health = self.health.current_value
         if self.overguard.current_value > 0:
-            self.overguard.current_value -= sum(damage * self.overguard.modifier * self.overguard.total_debuff)
+            self.overguard.current_value -= (damage * self.overguard.modifier * self.overguard.total_debuff).sum()
         elif self.shield.current_value > 0:
             self.health.current_value -= damage[6] * self.armor_dr[6] * self.health.modifier[6] * self.health.total_debuff
-            self.shield.current_value -= sum(damage * self.shield.modifier * self.shield.total_debuff)
+            self.shield.current_value -= (damage * self.shield.modifier * self.shield.total_debuff).sum()
         else:
-            self.health.current_value -= sum(damage * self.armor_dr * self.health.modifier * self.health.total_debuff)
+            self.health.current_value -= (damage * self.armor_dr * self.health.modifier * self.health.total_debuff).sum()
         
         # return applied damage
         return overguard - self.overguard.current_value, shield - self.shield.current_value, health - self.health.current_value
@@ -1,19 +1,34 @@
 from __future__ import annotations
 
+import heapq
 import numpy as np
 import os 
 from pathlib import Path
 import json
+import math
 import re
 import constants
+from constants import Mod
 
+from functools import lru_cache
 from random import random
 from typing import List, TYPE_CHECKING
 
+# prefer the ahead-of-time compiled kernels built by `python kernels.py`, fall back to jit compilation
+try:
+    from warframe_kernels import apply_mods_kernel
+except ImportError:
+    from kernels import apply_mods_kernel
+
 if TYPE_CHECKING:
     from simulation import Simulacrum
     from unit import Unit
 
+@lru_cache(maxsize=1)
+def _load_weapon_db(path:str) -> dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
 
 class Weapon():
     def __init__(self, name:str, ui, simulation:Simulacrum) -> None:
@@ -27,8 +42,7 @@ class Weapon():
     
     def get_weapon_data(self):
         current_folder = Path(__file__).parent.resolve()
-        with open(os.path.join(current_folder, "data", "ExportWeapons.json"), 'r') as f:
-            weapon_data = json.load(f)
+        weapon_data = _load_weapon_db(os.path.join(current_folder, "data", "ExportWeapons.json"))
 
         return weapon_data.get(self.name, {})
     
@@ -46,15 +60,17 @@ class FireMode():
         self.attack_index = 1
 
         self.trigger = self.data.get("trigger", "AUTO")
+        # the trigger type never changes, so pick the matching pull_trigger once
+        self.pull_trigger = self._pull_trigger_held if self.trigger == "HELD" else self._pull_trigger_normal
 
-        self.damagePerShot = DamageParameter( np.array(self.data.get("damagePerShot", np.array([0]*20)), dtype=float) )
-        self.elementalDamagePerShot = DamageParameter( np.array([0]*20, dtype=float) ) # physical and elemental modded damage - this is separate because of complications with quantization and status damage
+        self.damagePerShot = DamageParameter( self.data.get("damagePerShot", np.zeros(20)) )
+        self.elementalDamagePerShot = DamageParameter( np.zeros(20) ) # physical and elemental modded damage - this is separate because of complications with quantization and status damage
         self.criticalChance = Parameter( self.data.get("criticalChance", 0) )
         self.criticalMultiplier = Parameter( self.data.get("criticalMultiplier", 1) )
-        self.criticalMultiplier.base = round(self.criticalMultiplier.base * (128 - 1/32), 0) / (128 - 1/32) # quantization happens on the base value, not the modded value
+        self.criticalMultiplier.base = round(self.criticalMultiplier.base * constants.CRITICAL_MULTIPLIER_QUANTUM) * constants.CRITICAL_MULTIPLIER_QUANTUM_INV # quantization happens on the base value, not the modded value
         self.procChance = Parameter( self.data.get("procChance", 0) )
-        self.procProbabilities = np.array([0]*20, dtype=float)
-        self.procCumulativeProbabilities = np.array([0]*20, dtype=float)
+        self.procProbabilities = np.zeros(20)
+        self.procCumulativeProbabilities = np.zeros(20)
 
         self.magazineSize = ModifyParameter( self.data.get("magazineSize", 100) )
         self.fireRate = Parameter( self.data.get("fireRate", 5) )
@@ -68,34 +84,9 @@ class FireMode():
 
         self.radial = False
 
-        # mods
-        self.damagePerShot_m = {"base":0, "condition_overload_base":0, "condition_overload_multiplier":0, "direct":0, "final_multiplier":1, "multishot_multiplier":1}
-        self.bonusDamagePerShot_m = {"additive_base":0}
-        self.criticalChance_m = {"base":0, "additive_base":0, "additive_final":0, "covenant":0, "deadly_munitions":1}
-        self.criticalMultiplier_m = {"base":0, "additive_base":0, "additive_final":0, "final_multiplier":1}
-        self.procChance_m = {"base":0, "additive_base":0, "additive_final":0, "final_multiplier":1, "multishot_multiplier":1}
-        self.magazineSize_m = {"base":0}
-        self.fireRate_m = {"base":0, "final_multiplier":1}
-        self.reloadTime_m = {"base":0}
-        self.multishot_m = {"base":0}
-        self.heat_m = {"base":0, "uncombinable":0}
-        self.cold_m = {"base":0, "uncombinable":0}
-        self.electric_m = {"base":0, "uncombinable":0}
-        self.toxin_m = {"base":0, "uncombinable":0}
-        self.blast_m = {"base":0}
-        self.radiation_m = {"base":0}
-        self.gas_m = {"base":0}
-        self.magnetic_m = {"base":0}
-        self.viral_m = {"base":0}
-        self.corrosive_m = {"base":0}
-
-        self.impact_m = {"base":0, "stance":0}
-        self.puncture_m = {"base":0, "stance":0}
-        self.slash_m = {"base":0, "stance":0}
-
-        self.statusDuration_m = {"base":0}
-        self.factionDamage_m = {"base":0}
-        self.ammoCost_m = {"base":0, "energized_munitions":0}
+        # mods, indexed by constants.Mod. Write through set_mod so apply_mods knows to recompute
+        self.mods = constants.MOD_DEFAULTS.copy()
+        self.mods_dirty = True
 
         self.load_mods()
         self.apply_mods()
@@ -104,6 +95,7 @@ class FireMode():
 
     def reset(self):
         self.attack_index = 1
+        self.mods_dirty = True
 
         self.damagePerShot.reset()
         self.elementalDamagePerShot.reset()
@@ -117,106 +109,202 @@ class FireMode():
         self.ammoCost.reset()
         self.chargeTime.reset()
         self.embedDelay.reset()
+        self._update_shot_timings()
+
+    def set_mod(self, name:str, value:float):
+        # name is the mod group and key, ex. "criticalChance.additive_base"
+        self.mods[constants.MOD_INDEX[name]] = value
+        self.mods_dirty = True
 
     def load_mods(self):
-        self.damagePerShot_m["base"] = 0
-        self.damagePerShot_m["final_multiplier"] = 1
+        self.set_mod("damagePerShot.base", 0)
+        self.set_mod("damagePerShot.final_multiplier", 1)
 
     def apply_mods(self):
-        ## Damage
-        weights = self.damagePerShot.base/max(sum(self.damagePerShot.base), 0.01)
-        damagePerShot_bonus = weights * self.bonusDamagePerShot_m["additive_base"]
-        
-        self.damagePerShot.modded = (self.damagePerShot.base + damagePerShot_bonus) * \
-                                            (1 + self.damagePerShot_m["base"]) * \
-                                                self.damagePerShot_m["multishot_multiplier"] * \
-                                                    self.damagePerShot_m["final_multiplier"]
-        
-        # Bonus damage types
-        total_base_damage = sum(self.damagePerShot.modded)
-        self.elementalDamagePerShot.modded[0] = self.damagePerShot.modded[0] * self.impact_m["base"]
-        self.elementalDamagePerShot.modded[1] = self.damagePerShot.modded[1] * self.puncture_m["base"]
-        self.elementalDamagePerShot.modded[2] = self.damagePerShot.modded[2] * self.slash_m["base"]
-
-        self.elementalDamagePerShot.modded[3] = total_base_damage * self.heat_m["base"]
-        self.elementalDamagePerShot.modded[4] = total_base_damage * self.cold_m["base"]
-        self.elementalDamagePerShot.modded[5] = total_base_damage * self.electric_m["base"]
-        self.elementalDamagePerShot.modded[6] = total_base_damage * self.toxin_m["base"]
-
-        quanta = (total_base_damage + sum(self.elementalDamagePerShot.modded)) / 16
-        self.damagePerShot.quantized = np.round( self.damagePerShot.modded / quanta, 0) * quanta
-        self.elementalDamagePerShot.quantized = np.round( self.elementalDamagePerShot.modded / quanta, 0) * quanta
+        # nothing changed since the last call
+        if not self.mods_dirty:
+            return
+
+        ## Damage, bonus damage types, quantization and proc weights
+        # the kernel writes in place into the preallocated buffers
+        apply_mods_kernel(self.damagePerShot.base, self.mods, self.damagePerShot.modded, self.damagePerShot.quantized,
+                           self.elementalDamagePerShot.modded, self.elementalDamagePerShot.quantized, self.procProbabilities)
         
+        # plain floats keep the scalar parameters out of numpy scalar arithmetic in the hot path
+        m = self.mods.tolist()
+
         ## Critical Chance
         # puncture_count = self.proc_controller.puncture_proc_manager.count
         # criticalChance_puncture = 0 if self.radial else puncture_count * 0.05
-        self.criticalChance.modded = ((self.criticalChance.base + self.criticalChance_m["additive_base"]) * \
-                                                (1 + self.criticalChance_m["base"]) + self.criticalChance_m["additive_final"] ) * \
-                                                    self.criticalChance_m["deadly_munitions"] + self.criticalChance_m["covenant"]
+        self.criticalChance.modded = ((self.criticalChance.base + m[Mod.CRITICAL_CHANCE_ADDITIVE_BASE]) * \
+                                                (1 + m[Mod.CRITICAL_CHANCE_BASE]) + m[Mod.CRITICAL_CHANCE_ADDITIVE_FINAL] ) * \
+                                                    m[Mod.CRITICAL_CHANCE_DEADLY_MUNITIONS] + m[Mod.CRITICAL_CHANCE_COVENANT]
 
         # ## Critical Damage
         # cold_count = self.proc_controller.cold_proc_manager.count
         # criticalMultiplier_cold = 0 if self.radial else min(1, cold_count) * 0.1 + max(0, cold_count-1) * 0.05
-        self.criticalMultiplier.modded = ((self.criticalMultiplier.base + self.criticalMultiplier_m["additive_base"]) * \
-                                                    (1 + self.criticalMultiplier_m["base"]) + self.criticalMultiplier_m["additive_final"] ) * \
-                                                        self.criticalMultiplier_m["final_multiplier"]
+        self.criticalMultiplier.modded = ((self.criticalMultiplier.base + m[Mod.CRITICAL_MULTIPLIER_ADDITIVE_BASE]) * \
+                                                    (1 + m[Mod.CRITICAL_MULTIPLIER_BASE]) + m[Mod.CRITICAL_MULTIPLIER_ADDITIVE_FINAL] ) * \
+                                                        m[Mod.CRITICAL_MULTIPLIER_FINAL_MULTIPLIER]
 
         
 
         ## Status chance
-        self.procChance.modded = (self.procChance.base + self.procChance_m["additive_base"]) * \
-                                        ((1 + self.procChance_m["base"]) + self.procChance_m["additive_final"]) *\
-                                        self.procChance_m["final_multiplier"] * self.procChance_m["multishot_multiplier"]
-        self.procProbabilities = self.damagePerShot.modded + self.elementalDamagePerShot.modded
-        # self.procProbabilities *= self.procImmunities
-        tot_weight = sum(self.procProbabilities)
-        self.procProbabilities *= 1/tot_weight if tot_weight>0 else 0
-
+        self.procChance.modded = (self.procChance.base + m[Mod.PROC_CHANCE_ADDITIVE_BASE]) * \
+                                        ((1 + m[Mod.PROC_CHANCE_BASE]) + m[Mod.PROC_CHANCE_ADDITIVE_FINAL]) *\
+                                        m[Mod.PROC_CHANCE_FINAL_MULTIPLIER] * m[Mod.PROC_CHANCE_MULTISHOT_MULTIPLIER]
         self.procCumulativeProbabilities = 0
 
         ## Other
-        self.multishot.modded = self.multishot.base * (1 + self.multishot_m["base"])
-        self.fireRate.modded = self.fireRate.base * (1 + self.fireRate_m["base"])
-        self.reloadTime.modded = self.reloadTime.base / (1 + self.reloadTime_m["base"])
-        self.magazineSize.modded = self.magazineSize.base * (1 + self.magazineSize_m["base"])
-        self.chargeTime.modded = self.chargeTime.base / (1 + self.fireRate_m["base"])
-        self.magazineSize.modded = self.magazineSize.base * (1 + self.magazineSize_m["base"])
+        self.multishot.modded = self.multishot.base * (1 + m[Mod.MULTISHOT_BASE])
+        self.fireRate.modded = self.fireRate.base * (1 + m[Mod.FIRE_RATE_BASE])
+        self.reloadTime.modded = self.reloadTime.base / (1 + m[Mod.RELOAD_TIME_BASE])
+        self.magazineSize.modded = self.magazineSize.base * (1 + m[Mod.MAGAZINE_SIZE_BASE])
+        self.chargeTime.modded = self.chargeTime.base / (1 + m[Mod.FIRE_RATE_BASE])
+        self.magazineSize.modded = self.magazineSize.base * (1 + m[Mod.MAGAZINE_SIZE_BASE])
         self.embedDelay.modded = self.embedDelay.base
-        self.ammoCost.modded = self.ammoCost.base * max(0, 1 - self.ammoCost_m["base"]) * max(0, 1 - self.ammoCost_m["energized_munitions"])
+        self.ammoCost.modded = self.ammoCost.base * max(0, 1 - m[Mod.AMMO_COST_BASE]) * max(0, 1 - m[Mod.AMMO_COST_ENERGIZED_MUNITIONS])
 
-    def pull_trigger(self, fire_mode, enemy:Unit):
-        # add secondary effect to event queue and update its next event timestamp
+        self._update_shot_timings()
 
-        multishot_roll = get_tier(self.multishot.modded)
-        multishot = multishot_roll
+        self.mods_dirty = False
+
+    def _update_shot_timings(self):
+        # delay to the next trigger pull with ammo left and after a reload, some fire modes have no fire rate
+        fire_interval = 1/self.fireRate.modded if self.fireRate.modded > 0 else math.inf
+        self._shot_dt = fire_interval + self.chargeTime.modded
+        self._reload_dt = max(self.reloadTime.modded, fire_interval) + self.chargeTime.modded
 
+    def _pull_trigger_normal(self, fire_mode, enemy:Unit):
         self.magazineSize.current -= self.ammoCost.modded
+        self._fire(fire_mode, enemy, get_tier(self.multishot.modded))
 
-        if self.trigger == "HELD":
-            self.damagePerShot_m["multishot_multiplier"] = multishot_roll
-            self.procChance_m["multishot_multiplier"] = multishot_roll
-            multishot = 1
+    def _pull_trigger_held(self, fire_mode, enemy:Unit):
+        # held triggers fire a single pellet, multishot scales its damage and status chance instead
+        multishot_roll = get_tier(self.multishot.modded)
+        self.magazineSize.current -= self.ammoCost.modded
+        self.mods[Mod.DAMAGE_PER_SHOT_MULTISHOT_MULTIPLIER] = multishot_roll
+        self.mods[Mod.PROC_CHANCE_MULTISHOT_MULTIPLIER] = multishot_roll
+        self.mods_dirty = True
+        self._fire(fire_mode, enemy, 1)
+
+    def _fire(self, fire_mode, enemy:Unit, multishot:int):
+        # add pellets and secondary effects to event queue and schedule the next trigger pull
+        sim = self.simulation
+        event_queue = sim.event_queue
+        get_call_index = sim.get_call_index
+        push = heapq.heappush
+        now = sim.time
+
+        # every pellet lands at the same time, so the triggers are shared between pellets
+        fm_time = now + self.embedDelay.modded
+        pellet_trigger = EventTrigger(self, enemy.pellet_hit, fm_time)
+        fme_triggers = [EventTrigger(fme, enemy.pellet_hit, fme.embedDelay + fm_time) for fme in self.fire_mode_effects]
 
         for _ in range(multishot):
-            fm_time = self.simulation.time + self.embedDelay.modded
-            self.simulation.event_queue.put((fm_time, self.simulation.get_call_index(), EventTrigger(self, enemy.pellet_hit, fm_time)))
+            push(event_queue, (fm_time, get_call_index(), pellet_trigger))
 
-            for fme in self.fire_mode_effects:
-                fme_time = fme.embedDelay + fm_time
-                self.simulation.event_queue.put((fme_time, self.simulation.get_call_index(), EventTrigger(fme, enemy.pellet_hit, fme_time)))
+            for fme_trigger in fme_triggers:
+                push(event_queue, (fme_trigger.time, get_call_index(), fme_trigger))
 
 
         if self.magazineSize.current > 0:
-            next_event = self.simulation.time + 1/self.fireRate.modded + self.chargeTime.modded
-        # reload
+            next_event = now + self._shot_dt
         else:
-            self.magazineSize.current = self.magazineSize.modded
-            next_event = self.simulation.time + max(self.reloadTime.modded, 1/self.fireRate.modded) + self.chargeTime.modded
+            next_event = self._reload_next_event(now)
+
+        push(event_queue, (next_event, get_call_index(), EventTrigger(fire_mode, self.pull_trigger, next_event)))
+
+    def _reload_next_event(self, now):
+        self.magazineSize.current = self.magazineSize.modded
+        return now + self._reload_dt
+
+class FireModeBatch():
+    # runs apply_mods for many fire modes at once, ex. when comparing weapons or sweeping builds.
+    # Every parameter holds one row per fire mode and mods is a (fire modes, Mod) matrix
+    def __init__(self, fire_modes:List[FireMode]) -> None:
+        self.fire_modes = fire_modes
+
+        self.damagePerShot = DamageParameter( np.stack([fm.damagePerShot.base for fm in fire_modes]) )
+        self.elementalDamagePerShot = DamageParameter( np.zeros_like(self.damagePerShot.base) )
+        self.criticalChance = Parameter( np.array([fm.criticalChance.base for fm in fire_modes], dtype=float) )
+        self.criticalMultiplier = Parameter( np.array([fm.criticalMultiplier.base for fm in fire_modes], dtype=float) )
+        self.procChance = Parameter( np.array([fm.procChance.base for fm in fire_modes], dtype=float) )
+        self.procProbabilities = np.zeros_like(self.damagePerShot.base)
+
+        self.magazineSize = Parameter( np.array([fm.magazineSize.base for fm in fire_modes], dtype=float) )
+        self.fireRate = Parameter( np.array([fm.fireRate.base for fm in fire_modes], dtype=float) )
+        self.reloadTime = Parameter( np.array([fm.reloadTime.base for fm in fire_modes], dtype=float) )
+        self.multishot = Parameter( np.array([fm.multishot.base for fm in fire_modes], dtype=float) )
+        self.ammoCost = Parameter( np.array([fm.ammoCost.base for fm in fire_modes], dtype=float) )
+        self.chargeTime = Parameter( np.array([fm.chargeTime.base for fm in fire_modes], dtype=float) )
+
+        self.mods = np.empty((len(fire_modes), len(Mod)))
+        self.load_mods()
+
+    def load_mods(self):
+        # pick up the current mods of every fire mode
+        np.stack([fm.mods for fm in self.fire_modes], out=self.mods)
 
-        self.simulation.event_queue.put((next_event, self.simulation.get_call_index(), EventTrigger(fire_mode, self.pull_trigger, next_event)))
+    def apply_mods(self):
+        m = self.mods
+        base = self.damagePerShot.base
+        modded = self.damagePerShot.modded
+        elem_modded = self.elementalDamagePerShot.modded
+
+        ## Damage, same steps and rounding order as apply_mods_kernel
+        bonus_scale = m[:, Mod.BONUS_DAMAGE_PER_SHOT_ADDITIVE_BASE] / np.maximum(base.sum(axis=1), 0.01)
+        np.multiply(base, bonus_scale[:, None], out=modded)
+        modded += base
+        modded *= (1 + m[:, Mod.DAMAGE_PER_SHOT_BASE])[:, None]
+        modded *= m[:, Mod.DAMAGE_PER_SHOT_MULTISHOT_MULTIPLIER, None]
+        modded *= m[:, Mod.DAMAGE_PER_SHOT_FINAL_MULTIPLIER, None]
+        total_base_damage = modded.sum(axis=1)
+
+        # Bonus damage types
+        element_mods = m[:, constants.ELEMENT_MODS]
+        np.multiply(modded[:, :3], element_mods[:, :3], out=elem_modded[:, :3])
+        np.multiply(total_base_damage[:, None], element_mods[:, 3:], out=elem_modded[:, 3:7])
+
+        # rows without damage have nothing to quantize
+        quanta = (total_base_damage + elem_modded.sum(axis=1)) / 16
+        quanta = np.where(quanta > 0, quanta, 1)[:, None]
+        for damage, quantized in ((modded, self.damagePerShot.quantized), (elem_modded, self.elementalDamagePerShot.quantized)):
+            np.divide(damage, quanta, out=quantized)
+            np.round(quantized, 0, out=quantized)
+            quantized *= quanta
+
+        np.add(modded, elem_modded, out=self.procProbabilities)
+        tot_weight = self.procProbabilities.sum(axis=1)
+        self.procProbabilities *= np.divide(1, tot_weight, out=np.zeros_like(tot_weight), where=tot_weight > 0)[:, None]
+
+        ## Critical Chance
+        self.criticalChance.modded = ((self.criticalChance.base + m[:, Mod.CRITICAL_CHANCE_ADDITIVE_BASE]) * \
+                                                (1 + m[:, Mod.CRITICAL_CHANCE_BASE]) + m[:, Mod.CRITICAL_CHANCE_ADDITIVE_FINAL] ) * \
+                                                    m[:, Mod.CRITICAL_CHANCE_DEADLY_MUNITIONS] + m[:, Mod.CRITICAL_CHANCE_COVENANT]
+
+        ## Critical Damage
+        self.criticalMultiplier.modded = ((self.criticalMultiplier.base + m[:, Mod.CRITICAL_MULTIPLIER_ADDITIVE_BASE]) * \
+                                                    (1 + m[:, Mod.CRITICAL_MULTIPLIER_BASE]) + m[:, Mod.CRITICAL_MULTIPLIER_ADDITIVE_FINAL] ) * \
+                                                        m[:, Mod.CRITICAL_MULTIPLIER_FINAL_MULTIPLIER]
 
-def get_tier(chance):
-    return int(random()<(chance%1)) + int(chance)
+        ## Status chance
+        self.procChance.modded = (self.procChance.base + m[:, Mod.PROC_CHANCE_ADDITIVE_BASE]) * \
+                                        ((1 + m[:, Mod.PROC_CHANCE_BASE]) + m[:, Mod.PROC_CHANCE_ADDITIVE_FINAL]) *\
+                                        m[:, Mod.PROC_CHANCE_FINAL_MULTIPLIER] * m[:, Mod.PROC_CHANCE_MULTISHOT_MULTIPLIER]
+
+        ## Other
+        self.multishot.modded = self.multishot.base * (1 + m[:, Mod.MULTISHOT_BASE])
+        self.fireRate.modded = self.fireRate.base * (1 + m[:, Mod.FIRE_RATE_BASE])
+        self.reloadTime.modded = self.reloadTime.base / (1 + m[:, Mod.RELOAD_TIME_BASE])
+        self.magazineSize.modded = self.magazineSize.base * (1 + m[:, Mod.MAGAZINE_SIZE_BASE])
+        self.chargeTime.modded = self.chargeTime.base / (1 + m[:, Mod.FIRE_RATE_BASE])
+        self.ammoCost.modded = self.ammoCost.base * np.maximum(0, 1 - m[:, Mod.AMMO_COST_BASE]) * np.maximum(0, 1 - m[:, Mod.AMMO_COST_ENERGIZED_MUNITIONS])
+
+def get_tier(chance, _random=random, _floor=math.floor):
+    # integer part plus one more with the probability of the fractional part
+    tier = _floor(chance)
+    return tier + (_random() < chance - tier)
 
 class FireModeEffect():
     def __init__(self, fire_mode:FireMode, name:str) -> None:
@@ -237,13 +325,14 @@ class FireModeEffect():
 
 class DamageParameter():
     def __init__(self, base) -> None:
-        self.base = base
-        self.modded = base
-        self.quantized = base
+        self.base = np.asarray(base, dtype=np.float64)
+        # own buffers, apply_mods writes into them in place
+        self.modded = self.base.copy()
+        self.quantized = self.base.copy()
 
     def reset(self):
-        self.modded = self.base
-        self.quantized = self.base
+        np.copyto(self.modded, self.base)
+        np.copyto(self.quantized, self.base)
 
     def multiply(self, val):
         self.modded *= val
@@ -268,18 +357,21 @@ class Parameter():
         self.modded = self.base
 
 class EventTrigger():
+    __slots__ = ("fire_mode", "func", "time")
+
     def __init__(self, fire_mode:[FireModeEffect, FireMode], func, time:int) -> None:
         self.fire_mode = fire_mode
         self.func = func # should accept FireMode and Unit as arguments
         self.time = time   
 
+@lru_cache(maxsize=64)
+def _compile_rule(rule:str) -> re.Pattern:
+    return re.compile(rule)
+
 def parse_text(text, combine_rule=constants.COMBINE_ADD, parse_rule=constants.BASE_RULE):
     if combine_rule == constants.COMBINE_ADD:
-        return sum([float(i) for i in re.findall(parse_rule, text)])
+        return sum(float(i) for i in _compile_rule(parse_rule).findall(text))
     elif combine_rule == constants.COMBINE_MULTIPLY:
-        str_list = re.findall(constants.BASE_RULE, text)
-        if len(str_list)>0:
-            return np.prod(np.array([float(i) for i in str_list]))
-        else:
-            return 1
+        # empty product is 1
+        return math.prod(float(i) for i in _compile_rule(constants.BASE_RULE).findall(text))
     return None
\ No newline at end of file